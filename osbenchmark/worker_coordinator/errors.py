@@ -1,5 +1,9 @@
 import re
 
+# extracts e.g. 'indices:admin/create' from '... [indices:admin/create] ...'
+ACTION_PATTERN = re.compile(r"\[([^]]*)\]")
+
+
 def parse_error(error_metadata):
     error = error_metadata['error']
     status_code = None
@@ -11,20 +15,12 @@ def parse_error(error_metadata):
 
     if 'reason' in error:
         description = error['reason']
-        matches = re.findall(r'\[([^]]*)\]', description)
+        matches = ACTION_PATTERN.findall(description)
         for match in matches:
-            if match == "indices:admin/create":
-                operation = IndexOperationError(description, "index-create", status_code)
-            elif match == "indices:admin/delete":
-                operation =  IndexOperationError(description, "index-delete", status_code)
-            elif match == "indices:data/write/bulk":
-                operation = IndexOperationError(description, "index-append", status_code)
-            elif match == "indices:admin/refresh":
-                operation = IndexOperationError(description, "refresh-after-index", status_code)
-            elif match == "indices:admin/forcemerge":
-                operation = IndexOperationError(description, "force-merge", status_code)
-            elif match == "indices:data/read/search":
-                operation =  SearchOperationError(description, "search", status_code)
+            known_action = OPERATION_ERRORS_BY_ACTION.get(match)
+            if known_action:
+                error_type, operation_name = known_action
+                operation = error_type(description, operation_name, status_code)
 
     return operation
 
@@ -57,3 +53,14 @@ class SearchOperationError(OpenSearchOperationError):
             return f"internal server error for {self.operation} index. check logs for details"
         else:
             return self.description
+
+
+# maps transport actions mentioned in an error reason to the error type and the affected operation
+OPERATION_ERRORS_BY_ACTION = {
+    "indices:admin/create": (IndexOperationError, "index-create"),
+    "indices:admin/delete": (IndexOperationError, "index-delete"),
+    "indices:data/write/bulk": (IndexOperationError, "index-append"),
+    "indices:admin/refresh": (IndexOperationError, "refresh-after-index"),
+    "indices:admin/forcemerge": (IndexOperationError, "force-merge"),
+    "indices:data/read/search": (SearchOperationError, "search"),
+}
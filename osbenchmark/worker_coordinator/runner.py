@@ -702,6 +702,9 @@ class ForceMerge(Runner):
             self.logger.warning(
                 "%s will be updated to false to run force merge in asynchronous way", self.PARAM_WAIT_FOR_COMPLETION)
             merge_params[self.PARAM_WAIT_FOR_COMPLETION] = "false"
+            # back off gradually for long running merges (up to ``max-poll-period``) to avoid hammering the tasks API
+            poll_period = params.get("poll-period")
+            max_poll_period = max(poll_period, params.get("max-poll-period", poll_period))
             request_context_holder.on_client_request_start()
             response_task = await opensearch.indices.forcemerge(**merge_params)
             while True:
@@ -720,7 +723,8 @@ class ForceMerge(Runner):
                 if task['completed']:
                     request_context_holder.on_client_request_end()
                     break
-                await asyncio.sleep(params.get("poll-period"))
+                await asyncio.sleep(poll_period)
+                poll_period = min(poll_period * 1.5, max_poll_period)
         else:
             request_context_holder.on_client_request_start()
             await opensearch.indices.forcemerge(**merge_params)
@@ -2397,6 +2401,11 @@ class Retry(Runner, Delegator):
     def __repr__(self, *args, **kwargs):
         return "retryable %s" % repr(self.delegate)
 
+
+# ML Commons task states in which a task has not finished yet
+ML_TASK_IN_PROGRESS_STATES = ("CREATED", "RUNNING")
+
+
 class DeleteMlModel(Runner):
     @time_func
     async def __call__(self, opensearch, params):
@@ -2463,14 +2472,16 @@ class RegisterMlModel(Runner):
             task_id = resp.get('task_id')
             timeout = params.get('timeout', 120)
             end = time.time() + timeout
-            state = 'CREATED'
-            while state == 'CREATED' and time.time() < end:
+            # check right away instead of sleeping first so that fast registrations do not incur a fixed delay
+            resp = await opensearch.transport.perform_request('GET', '_plugins/_ml/tasks/' + task_id)
+            state = resp.get('state')
+            while state in ML_TASK_IN_PROGRESS_STATES and time.time() < end:
                 await asyncio.sleep(5)
                 resp = await opensearch.transport.perform_request('GET', '_plugins/_ml/tasks/' + task_id)
                 state = resp.get('state')
             if state == 'FAILED':
                 raise exceptions.BenchmarkError("Failed to register ml-model. Error: {}".format(resp['error']))
-            if state == 'CREATED':
+            if state in ML_TASK_IN_PROGRESS_STATES:
                 raise TimeoutError("Timeout when registering ml-model.")
             model_id = resp.get('model_id')
 
@@ -2492,14 +2503,16 @@ class DeployMlModel(Runner):
         task_id = resp.get('task_id')
         timeout = params.get('timeout', 120)
         end = time.time() + timeout
-        state = 'RUNNING'
-        while state == 'RUNNING' and time.time() < end:
+        # check right away instead of sleeping first so that fast deployments do not incur a fixed delay
+        resp = await opensearch.transport.perform_request('GET', '_plugins/_ml/tasks/' + task_id)
+        state = resp.get('state')
+        while state in ML_TASK_IN_PROGRESS_STATES and time.time() < end:
             await asyncio.sleep(5)
             resp = await opensearch.transport.perform_request('GET', '_plugins/_ml/tasks/' + task_id)
             state = resp.get('state')
         if state == 'FAILED':
             raise exceptions.BenchmarkError("Failed to deploy ml-model. Error: {}".format(resp['error']))
-        if state == 'RUNNING':
+        if state in ML_TASK_IN_PROGRESS_STATES:
             raise TimeoutError("Timeout when deploying ml-model.")
 
     def __repr__(self, *args, **kwargs):
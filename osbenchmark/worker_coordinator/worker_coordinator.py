@@ -39,6 +39,7 @@ from typing import Callable
 import time
 from enum import Enum
 
+import opensearchpy
 import thespian.actors
 
 from osbenchmark import actor, config, exceptions, metrics, workload, client, paths, PROGRAM_NAME, telemetry
@@ -1422,6 +1423,9 @@ class ThroughputCalculator:
 
 
 class AsyncIoAdapter:
+    # an adapter is created for every task, so we only log the choice of event loop once per (worker) process
+    uvloop_logged = False
+
     def __init__(self, cfg, workload, task_allocations, sampler, cancel, complete, abort_on_error):
         self.cfg = cfg
         self.workload = workload
@@ -1442,7 +1446,7 @@ class AsyncIoAdapter:
         # except RuntimeError:
         #     loop = asyncio.new_event_loop()
         #     asyncio.set_event_loop(loop)
-        loop = asyncio.new_event_loop()
+        loop = self._new_event_loop()
         loop.set_debug(self.debug_event_loop)
         loop.set_exception_handler(self._logging_exception_handler)
         asyncio.set_event_loop(loop)
@@ -1451,6 +1455,18 @@ class AsyncIoAdapter:
         finally:
             loop.close()
 
+    def _new_event_loop(self):
+        # uvloop is optional (install it with `pip install uvloop`) but reduces scheduling overhead for I/O-heavy workloads
+        try:
+            # pylint: disable=import-outside-toplevel
+            import uvloop
+        except ImportError:
+            return asyncio.new_event_loop()
+        if not AsyncIoAdapter.uvloop_logged:
+            self.logger.info("Using uvloop event loop.")
+            AsyncIoAdapter.uvloop_logged = True
+        return uvloop.new_event_loop()
+
     def _logging_exception_handler(self, loop, context):
         self.logger.error("Uncaught exception in event loop: %s", context)
 
@@ -1471,13 +1487,17 @@ class AsyncIoAdapter:
         runner.enable_assertions(self.assertions_enabled)
 
         aws = []
+        async_executors = []
         # A parameter source should only be created once per task - it is partitioned later on per client.
         params_per_task = {}
+        # The error behavior only depends on the task, so resolve it once for all of its clients.
+        error_behavior_per_task = {}
         for client_id, task_allocation in self.task_allocations:
             task = task_allocation.task
             if task not in params_per_task:
                 param_source = workload.operation_parameters(self.workload, task)
                 params_per_task[task] = param_source
+                error_behavior_per_task[task] = task.error_behavior(self.abort_on_error)
             # We cannot use the global client index here because we need to support parallel execution of tasks
             # with multiple clients. Consider the following scenario:
             #
@@ -1489,16 +1509,42 @@ class AsyncIoAdapter:
             schedule = schedule_for(task, task_allocation.client_index_in_task, params_per_task[task])
             async_executor = AsyncExecutor(
                 client_id, task, schedule, opensearch, self.sampler, self.cancel, self.complete,
-                task.error_behavior(self.abort_on_error))
+                error_behavior_per_task[task])
             final_executor = AsyncProfiler(async_executor) if self.profiling_enabled else async_executor
+            async_executors.append(async_executor)
             aws.append(final_executor())
         run_start = time.perf_counter()
+        executors = [asyncio.ensure_future(aw) for aw in aws]
         try:
-            _ = await asyncio.gather(*aws)
+            # Fail fast as soon as one client raises (or got cancelled by something other than us) but cancel and drain
+            # its peers explicitly instead of leaving them pending when the event loop gets closed.
+            pending = executors
+            failed = False
+            while pending and not failed:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failed = any(executor.cancelled() or executor.exception() is not None for executor in done)
+            for executor, async_executor in zip(executors, async_executors):
+                if executor in pending:
+                    async_executor.cancelled_by_peer = True
+                    executor.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            errors = []
+            for executor, async_executor in zip(executors, async_executors):
+                if executor in pending:
+                    continue
+                if executor.cancelled():
+                    errors.append(exceptions.BenchmarkError(
+                        f"Cannot run task [{async_executor.task}]: client [{async_executor.client_id}] was cancelled."))
+                elif executor.exception() is not None:
+                    errors.append(executor.exception())
+            for e in errors[1:]:
+                self.logger.error("Another client failed in the same task: %s", e)
+            if errors:
+                raise errors[0]
         finally:
             run_end = time.perf_counter()
             self.logger.info("Total run duration: %f seconds.", (run_end - run_start))
-            await asyncio.get_event_loop().shutdown_asyncgens()
+            await asyncio.get_running_loop().shutdown_asyncgens()
             shutdown_asyncgens_end = time.perf_counter()
             self.logger.info("Total time to shutdown asyncgens: %f seconds.", (shutdown_asyncgens_end - run_end))
             for s in opensearch.values():
@@ -1562,6 +1608,8 @@ class AsyncExecutor:
         self.cancel = cancel
         self.complete = complete
         self.on_error = on_error
+        # set by AsyncIoAdapter before it cancels this executor because another client has failed
+        self.cancelled_by_peer = False
         self.logger = logging.getLogger(__name__)
 
     async def __call__(self, *args, **kwargs):
@@ -1571,21 +1619,28 @@ class AsyncExecutor:
         self.logger.debug("Initializing schedule for client id [%s].", self.client_id)
         schedule = self.schedule_handle()
         self.logger.debug("Entering main loop for client id [%s].", self.client_id)
+        # bind frequently used callables once as this loop runs for every single request
+        perf_counter = time.perf_counter
+        wall_clock_time = time.time
+        sleep = asyncio.sleep
+        cancel_is_set = self.cancel.is_set
+        complete_is_set = self.complete.is_set
+        sampler_add = self.sampler.add
         # noinspection PyBroadException
         try:
             async for expected_scheduled_time, sample_type, percent_completed, runner, params in schedule:
-                if self.cancel.is_set():
+                if cancel_is_set():
                     self.logger.info("User cancelled execution.")
                     break
                 absolute_expected_schedule_time = total_start + expected_scheduled_time
                 throughput_throttled = expected_scheduled_time > 0
                 if throughput_throttled:
-                    rest = absolute_expected_schedule_time - time.perf_counter()
+                    rest = absolute_expected_schedule_time - perf_counter()
                     if rest > 0:
-                        await asyncio.sleep(rest)
+                        await sleep(rest)
 
-                absolute_processing_start = time.time()
-                processing_start = time.perf_counter()
+                absolute_processing_start = wall_clock_time()
+                processing_start = perf_counter()
                 self.schedule_handle.before_request(processing_start)
                 async with self.opensearch["default"].new_request_context() as request_context:
                     total_ops, total_ops_unit, request_meta_data = await execute_single(runner, self.opensearch, params, self.on_error)
@@ -1594,7 +1649,7 @@ class AsyncExecutor:
                     client_request_start = request_context.client_request_start
                     client_request_end = request_context.client_request_end
 
-                processing_end = time.perf_counter()
+                processing_end = perf_counter()
                 service_time = request_end - request_start
                 client_processing_time = (client_request_end - client_request_start) - service_time
                 processing_time = processing_end - processing_start
@@ -1621,7 +1676,7 @@ class AsyncExecutor:
                 if task_completes_parent:
                     completed = runner.completed
                 else:
-                    completed = self.complete.is_set() or runner.completed
+                    completed = complete_is_set() or runner.completed
                 # last sample should bump progress to 100% if externally completed.
                 if completed:
                     progress = 1.0
@@ -1630,27 +1685,38 @@ class AsyncExecutor:
                 else:
                     progress = percent_completed
 
-                self.sampler.add(self.task, self.client_id, sample_type, request_meta_data,
-                                 absolute_processing_start, request_start,
-                                 latency, service_time, client_processing_time, processing_time, throughput, total_ops, total_ops_unit,
-                                 time_period, progress, request_meta_data.pop("dependent_timing", None))
+                sampler_add(self.task, self.client_id, sample_type, request_meta_data,
+                            absolute_processing_start, request_start,
+                            latency, service_time, client_processing_time, processing_time, throughput, total_ops, total_ops_unit,
+                            time_period, progress, request_meta_data.pop("dependent_timing", None))
 
                 if completed:
                     self.logger.info("Task [%s] is considered completed due to external event.", self.task)
                     break
         except BaseException as e:
+            if self.cancelled_by_peer and isinstance(e, asyncio.CancelledError):
+                # another client has failed; this is not an error of this client
+                self.logger.debug("Execution of task [%s] for client id [%s] was cancelled.", self.task, self.client_id)
+                raise
             self.logger.exception("Could not execute schedule")
             raise exceptions.BenchmarkError(f"Cannot run task [{self.task}]: {e}") from None
         finally:
             # Actively set it if this task completes its parent
             if task_completes_parent:
-                self.logger.info("Task [%s] completes parent. Client id [%s] is finished executing it and signals completion.",
-                                 self.task, self.client_id)
+                if self.cancelled_by_peer:
+                    self.logger.info("Task [%s] completes parent. Client id [%s] was cancelled due to a failure of another "
+                                     "client and signals completion.", self.task, self.client_id)
+                else:
+                    self.logger.info("Task [%s] completes parent. Client id [%s] is finished executing it and signals "
+                                     "completion.", self.task, self.client_id)
                 self.complete.set()
 
 
 request_context_holder = client.RequestContextHolder()
 
+# keys in a runner's result that describe its weight and are not request meta-data
+OPERATION_WEIGHT_KEYS = frozenset(["weight", "unit"])
+
 
 async def execute_single(runner, opensearch, params, on_error):
     """
@@ -1658,21 +1724,20 @@ async def execute_single(runner, opensearch, params, on_error):
 
     :return: a triple of: total number of operations, unit of operations, a dict of request meta data (may be None).
     """
-    # pylint: disable=import-outside-toplevel
-    import opensearchpy
     fatal_error = False
     try:
         async with runner:
             return_value = await runner(opensearch, params)
-        if isinstance(return_value, tuple) and len(return_value) == 2:
+        # check the most common return type first
+        if isinstance(return_value, dict):
+            total_ops = return_value.get("weight", 1)
+            total_ops_unit = return_value.get("unit", "ops")
+            # copy instead of popping so we never mutate a dict that the runner may still hold on to
+            request_meta_data = {k: v for k, v in return_value.items() if k not in OPERATION_WEIGHT_KEYS}
+            request_meta_data.setdefault("success", True)
+        elif isinstance(return_value, tuple) and len(return_value) == 2:
             total_ops, total_ops_unit = return_value
             request_meta_data = {"success": True}
-        elif isinstance(return_value, dict):
-            total_ops = return_value.pop("weight", 1)
-            total_ops_unit = return_value.pop("unit", "ops")
-            request_meta_data = return_value
-            if "success" not in request_meta_data:
-                request_meta_data["success"] = True
         else:
             total_ops = 1
             total_ops_unit = "ops"
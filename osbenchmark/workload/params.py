@@ -835,6 +835,7 @@ class ForceMergeParamSource(ParamSource):
 
         self._max_num_segments = params.get("max-num-segments")
         self._poll_period = params.get("poll-period", 10)
+        self._max_poll_period = params.get("max-poll-period", self._poll_period)
         self._mode = params.get("mode", "blocking")
 
     def params(self):
@@ -842,7 +843,8 @@ class ForceMergeParamSource(ParamSource):
             "index": self._target_name,
             "max-num-segments": self._max_num_segments,
             "mode": self._mode,
-            "poll-period": self._poll_period
+            "poll-period": self._poll_period,
+            "max-poll-period": self._max_poll_period
         }
         parsed_params.update(self._client_params())
         return parsed_params
@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from osbenchmark.worker_coordinator import errors
+
+
+class ParseErrorTests(TestCase):
+    def test_index_operation_error(self):
+        error = errors.parse_error({
+            "error": {
+                "reason": "action [indices:admin/create] is unauthorized for user [benchmark]"
+            },
+            "status": 403
+        })
+        self.assertIsInstance(error, errors.IndexOperationError)
+        self.assertEqual("index-create", error.operation)
+        self.assertEqual("permission denied for index-create. check logs for details", error.get_error_message())
+
+    def test_search_operation_error(self):
+        error = errors.parse_error({
+            "error": {
+                "reason": "[node-1][127.0.0.1:9300][indices:data/read/search] failed"
+            },
+            "status": 500
+        })
+        self.assertIsInstance(error, errors.SearchOperationError)
+        self.assertEqual("search", error.operation)
+        self.assertEqual("internal server error for search index. check logs for details", error.get_error_message())
+
+    def test_unknown_action(self):
+        error = errors.parse_error({
+            "error": {
+                "reason": "action [cluster:monitor/health] failed"
+            },
+            "status": 500
+        })
+        self.assertIsInstance(error, errors.UnknownOperationError)
+        self.assertEqual("error occured, check logs for details", error.get_error_message())
@@ -1244,6 +1244,39 @@ class ForceMergeRunnerTests(TestCase):
         opensearch.tasks.get.assert_called_with(task_id="7PtzISisT5SiwlBGUi2GzQ:2820798")
         self.assertEqual(opensearch.tasks.get.call_count, 2)
 
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_end')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_start')
+    @mock.patch("opensearchpy.OpenSearch")
+    # To avoid real sleeps in unit tests
+    @mock.patch("asyncio.sleep", return_value=as_future())
+    @run_async
+    async def test_force_merge_with_polling_backs_off(self, sleep, opensearch, on_client_request_start, on_client_request_end):
+        opensearch.indices.forcemerge.return_value = as_future({"task": "7PtzISisT5SiwlBGUi2GzQ:2820798"})
+        opensearch.tasks.get.side_effect = [as_future({"completed": False}) for _ in range(4)] + [as_future({"completed": True})]
+        force_merge = runner.ForceMerge()
+        await force_merge(opensearch, params={
+            "index": "_all", "mode": "polling", "poll-period": 10, "max-poll-period": 20
+        })
+        self.assertEqual(opensearch.tasks.get.call_count, 5)
+        self.assertEqual([mock.call(10), mock.call(15.0), mock.call(20), mock.call(20)], sleep.call_args_list)
+
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_end')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_start')
+    @mock.patch("opensearchpy.OpenSearch")
+    # To avoid real sleeps in unit tests
+    @mock.patch("asyncio.sleep", return_value=as_future())
+    @run_async
+    async def test_force_merge_with_polling_ignores_lower_max_poll_period(self, sleep, opensearch, on_client_request_start,
+                                                                          on_client_request_end):
+        opensearch.indices.forcemerge.return_value = as_future({"task": "7PtzISisT5SiwlBGUi2GzQ:2820798"})
+        opensearch.tasks.get.side_effect = [as_future({"completed": False}) for _ in range(3)] + [as_future({"completed": True})]
+        force_merge = runner.ForceMerge()
+        await force_merge(opensearch, params={
+            "index": "_all", "mode": "polling", "poll-period": 10, "max-poll-period": 5
+        })
+        self.assertEqual(opensearch.tasks.get.call_count, 4)
+        self.assertEqual([mock.call(10), mock.call(10), mock.call(10)], sleep.call_args_list)
+
 
 class IndicesStatsRunnerTests(TestCase):
     @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_end')
@@ -6465,3 +6498,147 @@ class CreateSearchPipelineRunnerTests(TestCase):
             await r(opensearch, params)
 
         self.assertEqual(0, opensearch.transport.perform_request.call_count)
+
+
+class RegisterMlModelRunnerTests(TestCase):
+    PARAMS = {
+        "model-name": "model",
+        "model-version": "1.0.0",
+        "model-format": "TORCH_SCRIPT"
+    }
+
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_end')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_start')
+    @mock.patch("opensearchpy.OpenSearch")
+    # To avoid real sleeps in unit tests
+    @mock.patch("asyncio.sleep", return_value=as_future())
+    @run_async
+    async def test_does_not_wait_if_registered_immediately(self, sleep, opensearch, on_client_request_start,
+                                                           on_client_request_end, model_id_file):
+        opensearch.transport.perform_request.side_effect = [
+            as_future({"hits": {"hits": []}}),
+            as_future({"task_id": "task-1"}),
+            as_future({"state": "COMPLETED", "model_id": "model-1"})
+        ]
+
+        r = runner.RegisterMlModel()
+        await r(opensearch, params=RegisterMlModelRunnerTests.PARAMS)
+
+        opensearch.transport.perform_request.assert_has_calls([
+            mock.call("POST", "_plugins/_ml/models/_register", body={
+                "name": "model",
+                "version": "1.0.0",
+                "model_format": "TORCH_SCRIPT"
+            }),
+            mock.call("GET", "_plugins/_ml/tasks/task-1")
+        ])
+        self.assertEqual(0, sleep.call_count)
+        model_id_file.assert_called_once_with("model_id.json", "w")
+        model_id_file.return_value.write.assert_called_once_with('{"model_id": "model-1"}')
+
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_end')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_start')
+    @mock.patch("opensearchpy.OpenSearch")
+    # To avoid real sleeps in unit tests
+    @mock.patch("asyncio.sleep", return_value=as_future())
+    @run_async
+    async def test_waits_until_registered(self, sleep, opensearch, on_client_request_start, on_client_request_end, model_id_file):
+        opensearch.transport.perform_request.side_effect = [
+            as_future({"hits": {"hits": []}}),
+            as_future({"task_id": "task-1"}),
+            as_future({"state": "CREATED"}),
+            as_future({"state": "RUNNING"}),
+            as_future({"state": "COMPLETED", "model_id": "model-1"})
+        ]
+
+        r = runner.RegisterMlModel()
+        await r(opensearch, params=RegisterMlModelRunnerTests.PARAMS)
+
+        self.assertEqual(5, opensearch.transport.perform_request.call_count)
+        self.assertEqual(2, sleep.call_count)
+        model_id_file.return_value.write.assert_called_once_with('{"model_id": "model-1"}')
+
+    @mock.patch("builtins.open", new_callable=mock.mock_open)
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_end')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_start')
+    @mock.patch("opensearchpy.OpenSearch")
+    # To avoid real sleeps in unit tests
+    @mock.patch("asyncio.sleep", return_value=as_future())
+    @run_async
+    async def test_registration_failure(self, sleep, opensearch, on_client_request_start, on_client_request_end, model_id_file):
+        opensearch.transport.perform_request.side_effect = [
+            as_future({"hits": {"hits": []}}),
+            as_future({"task_id": "task-1"}),
+            as_future({"state": "FAILED", "error": "invalid model"})
+        ]
+
+        r = runner.RegisterMlModel()
+        with self.assertRaisesRegex(exceptions.BenchmarkError, r"Failed to register ml-model. Error: invalid model"):
+            await r(opensearch, params=RegisterMlModelRunnerTests.PARAMS)
+
+        self.assertEqual(0, model_id_file.return_value.write.call_count)
+
+
+class DeployMlModelRunnerTests(TestCase):
+    @mock.patch("builtins.open", new_callable=mock.mock_open, read_data='{"model_id": "model-1"}')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_end')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_start')
+    @mock.patch("opensearchpy.OpenSearch")
+    # To avoid real sleeps in unit tests
+    @mock.patch("asyncio.sleep", return_value=as_future())
+    @run_async
+    async def test_does_not_wait_if_deployed_immediately(self, sleep, opensearch, on_client_request_start,
+                                                         on_client_request_end, model_id_file):
+        opensearch.transport.perform_request.side_effect = [
+            as_future({"task_id": "task-1"}),
+            as_future({"state": "COMPLETED"})
+        ]
+
+        r = runner.DeployMlModel()
+        await r(opensearch, params={})
+
+        opensearch.transport.perform_request.assert_has_calls([
+            mock.call("POST", "_plugins/_ml/models/model-1/_deploy"),
+            mock.call("GET", "_plugins/_ml/tasks/task-1")
+        ])
+        self.assertEqual(0, sleep.call_count)
+
+    @mock.patch("builtins.open", new_callable=mock.mock_open, read_data='{"model_id": "model-1"}')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_end')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_start')
+    @mock.patch("opensearchpy.OpenSearch")
+    # To avoid real sleeps in unit tests
+    @mock.patch("asyncio.sleep", return_value=as_future())
+    @run_async
+    async def test_waits_until_deployed(self, sleep, opensearch, on_client_request_start, on_client_request_end, model_id_file):
+        opensearch.transport.perform_request.side_effect = [
+            as_future({"task_id": "task-1"}),
+            as_future({"state": "CREATED"}),
+            as_future({"state": "RUNNING"}),
+            as_future({"state": "COMPLETED"})
+        ]
+
+        r = runner.DeployMlModel()
+        await r(opensearch, params={})
+
+        self.assertEqual(4, opensearch.transport.perform_request.call_count)
+        self.assertEqual(2, sleep.call_count)
+
+    @mock.patch("builtins.open", new_callable=mock.mock_open, read_data='{"model_id": "model-1"}')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_end')
+    @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_start')
+    @mock.patch("opensearchpy.OpenSearch")
+    # To avoid real sleeps in unit tests
+    @mock.patch("asyncio.sleep", return_value=as_future())
+    @run_async
+    async def test_deployment_failure(self, sleep, opensearch, on_client_request_start, on_client_request_end, model_id_file):
+        opensearch.transport.perform_request.side_effect = [
+            as_future({"task_id": "task-1"}),
+            as_future({"state": "FAILED", "error": "out of memory"})
+        ]
+
+        r = runner.DeployMlModel()
+        with self.assertRaisesRegex(exceptions.BenchmarkError, r"Failed to deploy ml-model. Error: out of memory"):
+            await r(opensearch, params={})
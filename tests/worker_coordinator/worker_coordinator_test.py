@@ -21,10 +21,12 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+# pylint: disable=protected-access
 
 import asyncio
 import collections
 import io
+import sys
 import threading
 import time
 import unittest.mock as mock
@@ -1578,6 +1580,36 @@ class AsyncExecutorTests(TestCase):
             "success": True
         }, request_meta_data)
 
+    @run_async
+    async def test_execute_single_dict_does_not_modify_result(self):
+        opensearch = None
+        params = None
+        result = {
+            "weight": 50,
+            "unit": "docs",
+            "some-custom-meta-data": "valid"
+        }
+        runner = mock.Mock()
+        runner.return_value = as_future(result)
+
+        ops, unit, request_meta_data = await worker_coordinator.execute_single(
+            self.context_managed(runner),
+            opensearch,
+            params,
+            on_error="continue")
+
+        self.assertEqual(50, ops)
+        self.assertEqual("docs", unit)
+        self.assertEqual({
+            "some-custom-meta-data": "valid",
+            "success": True
+        }, request_meta_data)
+        self.assertEqual({
+            "weight": 50,
+            "unit": "docs",
+            "some-custom-meta-data": "valid"
+        }, result)
+
     @mock.patch('osbenchmark.client.RequestContextHolder.on_client_request_end')
     @run_async
     async def test_execute_single_with_connection_error_always_aborts(self, on_client_request_end):
@@ -1672,6 +1704,137 @@ class AsyncExecutorTests(TestCase):
             ctx.exception.args[0])
 
 
+class AsyncIoAdapterTests(TestCase):
+    class ScheduleHandle:
+        def __init__(self, runner):
+            self.runner = runner
+
+        def before_request(self, now):
+            pass
+
+        def after_request(self, now, weight, unit, meta_data):
+            pass
+
+        async def __call__(self):
+            while True:
+                yield 0, metrics.SampleType.Normal, 0, AsyncExecutorTests.context_managed(self.runner), {}
+
+    def setUp(self):
+        self.cfg = config.Config()
+        self.cfg.add(config.Scope.application, "worker_coordinator", "profiling", False)
+        self.cfg.add(config.Scope.application, "worker_coordinator", "assertions", False)
+        self.cfg.add(config.Scope.application, "client", "hosts",
+                     WorkerCoordinatorTests.Holder(all_hosts={"default": ["localhost:9200"]}))
+        client_options = mock.Mock()
+        client_options.with_max_connections.return_value = {"default": {}}
+        self.cfg.add(config.Scope.application, "client", "options", client_options)
+        self.task = workload.Task("no-op", workload.Operation("no-op", workload.OperationType.Bulk.to_hyphenated_string(),
+                                                              params={},
+                                                              param_source="worker-coordinator-test-param-source"),
+                                  clients=3)
+        worker_coordinator.AsyncIoAdapter.uvloop_logged = False
+        self.cancelled_clients = []
+
+    def adapter(self, task_allocations=None):
+        return worker_coordinator.AsyncIoAdapter(self.cfg, workload.Workload(name="unit-test"), task_allocations or [],
+                                                 worker_coordinator.Sampler(start_timestamp=0), threading.Event(),
+                                                 threading.Event(), abort_on_error=False)
+
+    def task_allocations(self, client_factory, schedule_for, runners):
+        opensearch = client_factory.return_value.create_async.return_value
+        opensearch.new_request_context.return_value = AsyncExecutorTests.StaticRequestTiming(task_start=0)
+        # the adapter runs its own event loop, so we cannot use a future that is bound to the test's loop
+        opensearch.transport.close = mock.AsyncMock()
+        schedule_for.side_effect = lambda task, client_index, param_source: AsyncIoAdapterTests.ScheduleHandle(runners[client_index])
+        return [(client_id, worker_coordinator.TaskAllocation(self.task, client_id)) for client_id in range(len(runners))]
+
+    def peer(self, client_index):
+        async def run(*args):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                self.cancelled_clients.append(client_index)
+                raise
+        return run
+
+    @mock.patch("osbenchmark.workload.operation_parameters")
+    @mock.patch("osbenchmark.worker_coordinator.worker_coordinator.schedule_for")
+    @mock.patch("osbenchmark.client.OsClientFactory")
+    def test_failing_client_cancels_peers(self, client_factory, schedule_for, operation_parameters):
+        async def fail(*args):
+            await asyncio.sleep(0.01)
+            raise exceptions.BenchmarkAssertionError("expected unit test exception")
+
+        task_allocations = self.task_allocations(client_factory, schedule_for, [self.peer(0), fail, self.peer(2)])
+
+        with self.assertLogs("osbenchmark.worker_coordinator.worker_coordinator", level="ERROR") as logs:
+            with self.assertRaisesRegex(exceptions.BenchmarkError, r"Cannot run task \[no-op\]: expected unit test exception"):
+                self.adapter(task_allocations)()
+
+        self.assertEqual([0, 2], sorted(self.cancelled_clients))
+        errors = [record for record in logs.records if record.getMessage() == "Could not execute schedule"]
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0].exc_info[1], exceptions.BenchmarkAssertionError)
+
+    @mock.patch("osbenchmark.workload.operation_parameters")
+    @mock.patch("osbenchmark.worker_coordinator.worker_coordinator.schedule_for")
+    @mock.patch("osbenchmark.client.OsClientFactory")
+    def test_runner_raising_cancelled_error_is_a_failure(self, client_factory, schedule_for, operation_parameters):
+        async def leak_cancellation(*args):
+            await asyncio.sleep(0.01)
+            raise asyncio.CancelledError()
+
+        task_allocations = self.task_allocations(client_factory, schedule_for, [self.peer(0), leak_cancellation, self.peer(2)])
+
+        with self.assertLogs("osbenchmark.worker_coordinator.worker_coordinator", level="ERROR") as logs:
+            with self.assertRaisesRegex(exceptions.BenchmarkError, r"Cannot run task \[no-op\]"):
+                self.adapter(task_allocations)()
+
+        self.assertEqual([0, 2], sorted(self.cancelled_clients))
+        errors = [record for record in logs.records if record.getMessage() == "Could not execute schedule"]
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0].exc_info[1], asyncio.CancelledError)
+
+    @mock.patch("osbenchmark.workload.operation_parameters")
+    @mock.patch("osbenchmark.worker_coordinator.worker_coordinator.schedule_for")
+    @mock.patch("osbenchmark.client.OsClientFactory")
+    def test_cancelled_client_is_a_failure(self, client_factory, schedule_for, operation_parameters):
+        class CancellingProfiler:
+            def __init__(self, target):
+                self.target = target
+
+            async def __call__(self, *args, **kwargs):
+                if self.target.client_id == 1:
+                    await asyncio.sleep(0.01)
+                    raise asyncio.CancelledError()
+                return await self.target(*args, **kwargs)
+
+        task_allocations = self.task_allocations(client_factory, schedule_for, [self.peer(0), self.peer(1), self.peer(2)])
+        self.cfg.add(config.Scope.application, "worker_coordinator", "profiling", True)
+
+        with mock.patch("osbenchmark.worker_coordinator.worker_coordinator.AsyncProfiler", CancellingProfiler):
+            with self.assertRaisesRegex(exceptions.BenchmarkError, r"Cannot run task \[no-op\]: client \[1\] was cancelled."):
+                self.adapter(task_allocations)()
+
+        self.assertEqual([0, 2], sorted(self.cancelled_clients))
+
+    def test_uses_uvloop_if_available(self):
+        uvloop = mock.Mock()
+        with mock.patch.dict(sys.modules, {"uvloop": uvloop}):
+            adapter = self.adapter()
+            with self.assertLogs("osbenchmark.worker_coordinator.worker_coordinator", level="INFO") as logs:
+                self.assertIs(uvloop.new_event_loop.return_value, adapter._new_event_loop())
+                self.assertIs(uvloop.new_event_loop.return_value, adapter._new_event_loop())
+        # only logged once per process although an adapter creates a loop for every task
+        self.assertEqual(["Using uvloop event loop."], [record.getMessage() for record in logs.records])
+
+    @mock.patch("asyncio.new_event_loop")
+    def test_falls_back_to_asyncio_event_loop(self, new_event_loop):
+        # a None entry in sys.modules makes the import raise ImportError
+        with mock.patch.dict(sys.modules, {"uvloop": None}):
+            self.assertIs(new_event_loop.return_value, self.adapter()._new_event_loop())
+
+
 class AsyncProfilerTests(TestCase):
     @pytest.mark.skip(reason="latency is system-dependent")
     @run_async
@@ -2528,6 +2528,8 @@ class ForceMergeParamSourceTests(TestCase):
 
         self.assertEqual("_all", p["index"])
         self.assertEqual("blocking", p["mode"])
+        self.assertEqual(10, p["poll-period"])
+        self.assertEqual(10, p["max-poll-period"])
 
     def test_force_merge_all_params(self):
         source = params.ForceMergeParamSource(workload.Workload(name="unit-test"), params={"index": "index2",
@@ -2543,6 +2545,16 @@ class ForceMergeParamSourceTests(TestCase):
         self.assertEqual(1, p["max-num-segments"])
         self.assertEqual("polling", p["mode"])
 
+    def test_force_merge_max_poll_period(self):
+        source = params.ForceMergeParamSource(workload.Workload(name="unit-test"), params={"mode": "polling",
+                                                                                     "poll-period": 5,
+                                                                                     "max-poll-period": 60})
+
+        p = source.params()
+
+        self.assertEqual(5, p["poll-period"])
+        self.assertEqual(60, p["max-poll-period"])
+
 
 class VectorSearchParamSourceTests(TestCase):
     DEFAULT_INDEX_NAME = "test-index"